@@ -1,10 +1,12 @@
 import streamlit as st
 import logging
+import operator
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import custom modules
-from config import TEMP_DOWNLOAD_DIR
+from config import get_temp_download_dir
 from services.youtube_extractor import YouTubeExtractor
 from services.audio_downloader import AudioDownloader
 from ui.download_options import DownloadOptionsUI
@@ -18,6 +20,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@st.cache_resource
+def get_extractor():
+    """
+    Process-wide YouTubeExtractor shared across Streamlit reruns
+    """
+    return YouTubeExtractor()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_extract_video(url):
+    """
+    Cached single-video extraction keyed on URL
+
+    Streamlit reruns the script on every widget change; caching the
+    network-bound extraction means only the first run hits YouTube.
+    """
+    return get_extractor().extract_video_info(url)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_extract_playlist(url):
+    """
+    Cached playlist extraction keyed on URL
+    """
+    return get_extractor().extract_playlist_videos(url)
+
 class YouTubeAudioDownloaderApp:
     """
     Main Streamlit application for YouTube Audio Downloader
@@ -36,8 +62,8 @@ class YouTubeAudioDownloaderApp:
         )
 
         # Initialize services and utilities
-        self.extractor = YouTubeExtractor()
-        self.output_dir = TEMP_DOWNLOAD_DIR
+        self.extractor = get_extractor()
+        self.output_dir = get_temp_download_dir()
 
     def run(self):
         """
@@ -114,12 +140,12 @@ class YouTubeAudioDownloaderApp:
             List[VideoInfo]: Extracted videos
         """
         if YouTubeURLValidator.is_playlist_url(url):
-            return self.extractor.extract_playlist_videos(url)
+            return _cached_extract_playlist(url)
         elif YouTubeURLValidator.is_channel_url(url):
             return self.extractor.get_channel_videos(url)
         else:
             # Single video
-            video = self.extractor.extract_video_info(url)
+            video = _cached_extract_video(url)
             return [video] if video else []
 
     def _generate_custom_titles(
@@ -139,15 +165,23 @@ class YouTubeAudioDownloaderApp:
         Returns:
             List[str]: Custom titles
         """
+        # Batch the title construction through map() - one C-level loop
+        # instead of a per-item interpreter frame at playlist scale
+        n = len(videos)
+
         if naming_method == "Original Video Titles":
-            return [video.title for video in videos]
-        
+            return list(map(operator.attrgetter('title'), videos))
+
         if naming_method == "Custom Prefix":
             prefix = custom_prefix or "audio"
-            return [f"{prefix}_{i+1}" for i in range(len(videos))]
-        
+            # The prefix is raw user input - escape braces so it cannot
+            # be interpreted as format-string syntax
+            safe_prefix = prefix.replace('{', '{{').replace('}', '}}')
+            return list(map(f"{safe_prefix}_{{}}".format, range(1, n + 1)))
+
         if naming_method == "Numbered Sequence":
-            return [f"track_{i+1}" for i in range(len(videos))]
+            width = len(str(n))
+            return list(map(f"track_{{:0{width}d}}".format, range(1, n + 1)))
 
     def _perform_download(
         self, 
@@ -176,7 +210,7 @@ class YouTubeAudioDownloaderApp:
         else:
             output_dir = (
                 tempfile.mkdtemp() if download_method == "Temporary Directory"
-                else TEMP_DOWNLOAD_DIR
+                else get_temp_download_dir()
             )
 
         # Initialize downloader with selected format and quality
@@ -186,27 +220,46 @@ class YouTubeAudioDownloaderApp:
             quality=audio_quality
         )
 
-        # Initialize progress tracker
-        progress_tracker = DownloadProgressTracker(len(videos))
+        # Single placeholders updated in place - avoids re-rendering the
+        # whole script per finished video
+        progress_ph = st.empty()
+        status_ph = st.empty()
 
-        # Perform downloads
+        # Perform downloads concurrently, updating progress as each
+        # video finishes; target paths are reserved serially up front so
+        # same-titled videos cannot race onto one filename
         successful_videos = []
         failed_videos = []
+        total = len(videos)
+        targets = downloader.assign_target_paths(videos, custom_titles)
 
-        for video, title in zip(videos, custom_titles):
-            try:
-                download_result = downloader.download_audio(
-                    video, 
-                    custom_title=title
-                )
-                
-                if download_result:
-                    successful_videos.append(video)
-                else:
+        with ThreadPoolExecutor(
+            max_workers=min(total, downloader.max_workers)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    downloader.download_audio,
+                    video,
+                    target_path=target
+                ): video
+                for video, target in zip(videos, targets)
+            }
+
+            done = 0
+            for future in as_completed(futures):
+                video = futures[future]
+                try:
+                    if future.result():
+                        successful_videos.append(video)
+                    else:
+                        failed_videos.append(video)
+                except Exception as e:
+                    logger.error(f"Download failed for {video.title}: {e}")
                     failed_videos.append(video)
-            except Exception as e:
-                logger.error(f"Download failed for {video.title}: {e}")
-                failed_videos.append(video)
+
+                done += 1
+                progress_ph.progress(done / total)
+                status_ph.text(f"Finished: {video.title} ({done}/{total})")
 
         # Display download summary
         summary = DownloadProgressTracker.create_download_summary(
@@ -1,10 +1,25 @@
+import atexit
+import shutil
 import tempfile
 import os
 
 # Directory Configurations
-TEMP_DOWNLOAD_DIR = tempfile.mkdtemp()
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Created lazily - mkdtemp() at import time would leak a new directory
+# on every Streamlit rerun of a long-lived process
+_TEMP_DOWNLOAD_DIR = None
+
+def get_temp_download_dir() -> str:
+    """
+    Return the shared temporary download directory, creating it on first use
+    """
+    global _TEMP_DOWNLOAD_DIR
+    if _TEMP_DOWNLOAD_DIR is None:
+        _TEMP_DOWNLOAD_DIR = tempfile.mkdtemp(prefix='ytdl_')
+        atexit.register(shutil.rmtree, _TEMP_DOWNLOAD_DIR, ignore_errors=True)
+    return _TEMP_DOWNLOAD_DIR
+
 # FFmpeg Configuration
 FFMPEG_PATH = r"C:\Python312\ffmpeg\bin\ffmpeg.exe"  # Adjust based on your system
 FFMPEG_SYSTEM_PATH = "ffmpeg"  # Fallback system path
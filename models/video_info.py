@@ -1,9 +1,18 @@
-from dataclasses import dataclass
-import re
+from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
 
-@dataclass
+# Translation table built once at import time - clean_filename runs for
+# every video in a playlist, and a single translate() pass strips
+# invalid characters and converts whitespace without the regex engine
+_CLEAN_TABLE = str.maketrans(
+    {c: None for c in '\\/*?:"<>|'} | {c: '_' for c in ' \t\n\r\v\f'}
+)
+_TRIM_CHARS = '. '
+
+# slots avoids a per-instance __dict__ (significant at playlist scale)
+# and frozen makes instances hashable for cache keys
+@dataclass(slots=True, frozen=True)
 class VideoInfo:
     url: str
     title: str
@@ -13,6 +22,12 @@ class VideoInfo:
     view_count: Optional[int] = None
     thumbnail_url: Optional[str] = None
 
+    # Lazily-populated cache of the cleaned title, so repeated name
+    # generation across UI reruns sanitizes each title at most once
+    _cached_clean: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @staticmethod
     def clean_filename(title: str, max_length: int = 255) -> str:
         """
@@ -25,17 +40,18 @@ class VideoInfo:
         Returns:
             str: Cleaned filename
         """
-        # Remove invalid filename characters
-        cleaned_title = re.sub(r'[\\/*?:"<>|]', "", title)
-        
-        # Replace spaces and multiple spaces with single underscore
-        cleaned_title = re.sub(r'\s+', '_', cleaned_title)
-        
+        # Strip invalid characters and convert whitespace in one pass
+        cleaned_title = title.translate(_CLEAN_TABLE)
+
+        # Collapse runs of underscores left by consecutive whitespace
+        while '__' in cleaned_title:
+            cleaned_title = cleaned_title.replace('__', '_')
+
         # Truncate to max length
         cleaned_title = cleaned_title[:max_length]
-        
+
         # Remove trailing periods or spaces
-        cleaned_title = cleaned_title.strip('. ')
+        cleaned_title = cleaned_title.strip(_TRIM_CHARS)
         
         return cleaned_title if cleaned_title else "unnamed_video"
 
@@ -50,11 +66,19 @@ class VideoInfo:
         Returns:
             str: Fully sanitized filename
         """
-        base_title = self.clean_filename(self.title)
-        
-        # Combine prefix, base title, and suffix
+        base_title = self._cached_clean
+        if base_title is None:
+            base_title = self.clean_filename(self.title)
+            # Bypass frozen=True for the cache slot only
+            object.__setattr__(self, '_cached_clean', base_title)
+
+        if not prefix and not suffix:
+            return base_title
+
+        # Combine prefix, base title, and suffix; only the added parts
+        # still need cleaning
         full_title = f"{prefix}_{base_title}_{suffix}".strip('_')
-        
+
         return self.clean_filename(full_title)
 
     def __repr__(self) -> str:
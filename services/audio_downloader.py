@@ -1,10 +1,12 @@
 import os
-import yt_dlp
+import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List, Dict, Any
 
 from models.video_info import VideoInfo
 from utils.file_helpers import FileHelper
+from utils.url_validator import YouTubeURLValidator
 from config import (
     FFMPEG_PATH, 
     PREFERRED_AUDIO_FORMAT, 
@@ -18,30 +20,58 @@ class AudioDownloader:
     """
 
     def __init__(
-        self, 
-        output_dir: str, 
+        self,
+        output_dir: str,
         audio_format: str = PREFERRED_AUDIO_FORMAT,
-        quality: str = AUDIO_QUALITY
+        quality: str = AUDIO_QUALITY,
+        max_workers: Optional[int] = None,
+        skip_existing: bool = True
     ):
         """
         Initialize AudioDownloader with configuration options
-        
+
         Args:
             output_dir (str): Base directory for downloads
             audio_format (str): Preferred audio format
             quality (str): Audio quality setting
+            max_workers (Optional[int]): Concurrent download workers for batch downloads
+            skip_existing (bool): Reuse an already-downloaded file instead of re-downloading
         """
         self.output_dir = output_dir
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.skip_existing = skip_existing
         self.logger = logging.getLogger(__name__)
-        
-        # Comprehensive yt-dlp options for audio extraction
-        self.ydl_opts = {
-            'format': 'bestaudio/best',
-            'postprocessors': [{
+
+        # Tune extraction per target format: for m4a/webm, request a
+        # source already in that container so FFmpegExtractAudio's
+        # copy-when-codec-matches path skips the re-encode entirely;
+        # for lossy re-encodes let ffmpeg use all cores
+        if audio_format in ('m4a', 'webm'):
+            format_selector = f'bestaudio[ext={audio_format}]/bestaudio'
+            postprocessor = {
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': audio_format,
+                'preferredquality': '0',
+                'nopostoverwrites': False,
+            }
+            postprocessor_args = {}
+        else:
+            format_selector = 'bestaudio/best'
+            postprocessor = {
                 'key': 'FFmpegExtractAudio',
                 'preferredcodec': audio_format,
                 'preferredquality': quality,
-            }],
+            }
+            # yt-dlp matches these args on the PP name lowercased
+            postprocessor_args = {
+                'extractaudio': ['-threads', str(os.cpu_count() or 1)]
+            }
+
+        # Comprehensive yt-dlp options for audio extraction
+        self._base_opts = {
+            'format': format_selector,
+            'postprocessors': [postprocessor],
+            'postprocessor_args': postprocessor_args,
             'outtmpl': '%(title)s.%(ext)s',
             'no_color': True,
             'no_warnings': True,
@@ -54,6 +84,9 @@ class AudioDownloader:
             # Retry and connection settings
             'retries': MAX_RETRY_ATTEMPTS,
             'fragment_retries': 2,
+            # Fetch media fragments concurrently so many small HTTP
+            # requests overlap instead of serializing
+            'concurrent_fragment_downloads': 4,
             'buffer_size': 1024 * 1024,  # 1MB buffer
             'no_part': True,  # Disable .part file creation
             
@@ -62,57 +95,164 @@ class AudioDownloader:
             'age_limit': 0,
         }
 
+        # One persistent YoutubeDL session per worker thread - reuses
+        # HTTP keep-alive connections between videos without sharing a
+        # mutable session across threads
+        self._thread_local = threading.local()
+
+    def _get_ydl(self) -> 'yt_dlp.YoutubeDL':
+        """
+        Return this thread's persistent YoutubeDL session, creating it on first use
+        """
+        # Imported lazily - yt-dlp's import graph is heavy and only
+        # needed once a download actually starts
+        import yt_dlp
+
+        ydl = getattr(self._thread_local, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(dict(self._base_opts))
+            self._thread_local.ydl = ydl
+        return ydl
+
+    def assign_target_paths(
+        self,
+        videos: List[VideoInfo],
+        custom_titles: Optional[List[str]] = None,
+        playlist_folder: Optional[str] = None
+    ) -> List[str]:
+        """
+        Reserve a unique output path for each video before workers start
+
+        Concurrent workers probing the directory independently would
+        race same-titled videos onto one path; assigning names serially
+        up front guarantees every worker a distinct target.
+
+        Args:
+            videos (List[VideoInfo]): Videos awaiting download
+            custom_titles (Optional[List[str]]): Custom titles for each video
+            playlist_folder (Optional[str]): Subfolder for downloads
+
+        Returns:
+            List[str]: One output filepath per video
+        """
+        if not custom_titles:
+            custom_titles = [video.title for video in videos]
+        custom_titles = custom_titles[:len(videos)]
+
+        output_dir = self.output_dir
+        if playlist_folder:
+            output_dir = os.path.join(output_dir, playlist_folder)
+        FileHelper.create_directory(output_dir)
+
+        audio_format = self._base_opts["postprocessors"][0]["preferredcodec"]
+
+        try:
+            with os.scandir(output_dir) as entries:
+                existing = {entry.name for entry in entries}
+        except FileNotFoundError:
+            existing = set()
+
+        # Names claimed so far: files already on disk plus the paths
+        # reserved for earlier videos in this batch
+        taken = set(existing)
+
+        paths = []
+        for video, title in zip(videos, custom_titles):
+            sanitized = FileHelper.sanitize_filename(title or video.title)
+            name = f'{sanitized}.{audio_format}'
+
+            if self.skip_existing and name in existing:
+                # File already on disk - download_audio will reuse it
+                paths.append(os.path.join(output_dir, name))
+                continue
+
+            counter = 1
+            while name in taken:
+                name = f'{sanitized}_{counter}.{audio_format}'
+                counter += 1
+
+            taken.add(name)
+            paths.append(os.path.join(output_dir, name))
+
+        return paths
+
     def download_audio(
-        self, 
-        video: VideoInfo, 
+        self,
+        video: VideoInfo,
         custom_title: Optional[str] = None,
-        playlist_folder: Optional[str] = None
+        playlist_folder: Optional[str] = None,
+        target_path: Optional[str] = None
     ) -> Optional[str]:
         """
         Download audio for a single video
-        
+
         Args:
             video (VideoInfo): Video information
             custom_title (Optional[str]): Custom filename
             playlist_folder (Optional[str]): Subfolder for playlist downloads
-        
+            target_path (Optional[str]): Pre-assigned output path from
+                assign_target_paths; skips per-call filename probing
+
         Returns:
             Optional[str]: Path to downloaded audio file
         """
         try:
-            # Determine output directory
-            output_dir = self.output_dir
-            if playlist_folder:
-                output_dir = os.path.join(output_dir, playlist_folder)
-            
-            # Ensure output directory exists
-            FileHelper.create_directory(output_dir)
-            
-            # Prepare filename
-            filename = custom_title or video.title
-            sanitized_filename = FileHelper.sanitize_filename(filename)
-            
-            # Generate unique filepath
-            filepath = FileHelper.generate_unique_filename(
-                output_dir, 
-                sanitized_filename, 
-                f'.{self.ydl_opts["postprocessors"][0]["preferredcodec"]}'
-            )
-            
-            # Update yt-dlp options with specific output template
-            self.ydl_opts['outtmpl'] = filepath
+            if target_path is not None:
+                # Path was reserved serially - no directory probing here
+                filepath = target_path
+                FileHelper.create_directory(os.path.dirname(filepath))
+
+                if self.skip_existing and os.path.exists(filepath):
+                    self.logger.info(f"Skipping existing download: {filepath}")
+                    return filepath
+            else:
+                # Determine output directory
+                output_dir = self.output_dir
+                if playlist_folder:
+                    output_dir = os.path.join(output_dir, playlist_folder)
+
+                # Ensure output directory exists
+                FileHelper.create_directory(output_dir)
+
+                # Prepare filename
+                filename = custom_title or video.title
+                sanitized_filename = FileHelper.sanitize_filename(filename)
+
+                # Skip the network/FFmpeg cycle entirely when a previous
+                # run already produced this file
+                audio_format = self._base_opts["postprocessors"][0]["preferredcodec"]
+                canonical = os.path.join(
+                    output_dir, f'{sanitized_filename}.{audio_format}'
+                )
+                if self.skip_existing and os.path.exists(canonical):
+                    self.logger.info(f"Skipping existing download: {canonical}")
+                    return canonical
+
+                # Generate unique filepath
+                filepath = FileHelper.generate_unique_filename(
+                    output_dir,
+                    sanitized_filename,
+                    f'.{audio_format}'
+                )
             
-            # Download audio
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                ydl.download([video.url])
+            # Reuse this thread's session; only its own output template
+            # changes between downloads, so no cross-thread mutation.
+            # YoutubeDL normalizes outtmpl into a dict at init, so the
+            # live session must be given the dict form - a raw string
+            # breaks prepare_filename
+            ydl = self._get_ydl()
+            ydl.params['outtmpl'] = {'default': filepath}
+            ydl.download([video.url])
             
-            # Verify file exists
-            if os.path.exists(filepath):
-                self.logger.info(f"Successfully downloaded: {filepath}")
-                return filepath
-            else:
+            # Verify file exists - one stat, no separate exists check
+            try:
+                os.stat(filepath)
+            except FileNotFoundError:
                 self.logger.warning(f"Download completed but file not found: {filepath}")
                 return None
+
+            self.logger.info(f"Successfully downloaded: {filepath}")
+            return filepath
         
         except Exception as e:
             self.logger.error(f"Download failed for {video.title}: {e}")
@@ -141,18 +281,130 @@ class AudioDownloader:
         
         # Ensure titles list matches videos list
         custom_titles = custom_titles[:len(videos)]
-        
+
+        if not videos:
+            return []
+
+        # Reserve target filenames serially before any worker starts -
+        # concurrent workers probing the directory themselves would race
+        # same-titled videos onto one path
+        targets = self.assign_target_paths(
+            videos, custom_titles, playlist_folder
+        )
+
+        # Downloads are network/FFmpeg-bound, so overlap them with a
+        # bounded pool of workers
         downloaded_files = []
+        with ThreadPoolExecutor(
+            max_workers=min(len(videos), self.max_workers)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.download_audio,
+                    video,
+                    target_path=target
+                ): video
+                for video, target in zip(videos, targets)
+            }
+
+            for future in as_completed(futures):
+                filepath = future.result()
+                if filepath:
+                    downloaded_files.append(filepath)
+
+        return downloaded_files
+
+    def download_batch(
+        self,
+        videos: List[VideoInfo],
+        custom_titles: Optional[List[str]] = None,
+        playlist_folder: Optional[str] = None
+    ) -> List[str]:
+        """
+        Download multiple videos through a single YoutubeDL session
+
+        Amortizes the per-video setup cost (cookie jar, extractor
+        registry, postprocessor construction) across the whole batch by
+        issuing one download call for all URLs.
+
+        Args:
+            videos (List[VideoInfo]): List of videos to download
+            custom_titles (Optional[List[str]]): Custom titles for each video
+            playlist_folder (Optional[str]): Subfolder for downloads
+
+        Returns:
+            List[str]: Paths of successfully downloaded files
+        """
+        if not videos:
+            return []
+
+        # Use original titles if no custom titles provided
+        if not custom_titles:
+            custom_titles = [video.title for video in videos]
+        custom_titles = custom_titles[:len(videos)]
+
+        # Determine output directory
+        output_dir = self.output_dir
+        if playlist_folder:
+            output_dir = os.path.join(output_dir, playlist_folder)
+        FileHelper.create_directory(output_dir)
+
+        # Requested title per video ID, for renaming after
+        # postprocessing. yt-dlp reports the canonical watch URL, which
+        # need not match the caller's input (youtu.be, m.youtube.com,
+        # extra query params) - the video ID is stable across both
+        title_by_id = {}
         for video, title in zip(videos, custom_titles):
-            filepath = self.download_audio(
-                video, 
-                custom_title=title, 
-                playlist_folder=playlist_folder
-            )
-            
+            video_id = YouTubeURLValidator.extract_video_id(video.url)
+            title_by_id[video_id or video.url] = title
+
+        # Final filepath per video ID, captured as postprocessing
+        # finishes. Every registered postprocessor emits its own
+        # 'finished' event (ExtractAudio's still points at the original
+        # media file), so keep only the last event per video - that one
+        # carries the real output path
+        finished = {}
+
+        def _capture_finished(progress):
+            if progress.get('status') != 'finished':
+                return
+            info = progress.get('info_dict') or {}
+            filepath = info.get('filepath')
             if filepath:
-                downloaded_files.append(filepath)
-        
+                finished[info.get('id') or info.get('webpage_url')] = filepath
+
+        opts = {
+            **self._base_opts,
+            'outtmpl': os.path.join(output_dir, '%(title)s.%(ext)s'),
+            'postprocessor_hooks': [_capture_finished],
+            'ignoreerrors': True,  # Keep the batch going past one failure
+        }
+
+        import yt_dlp
+
+        try:
+            with yt_dlp.YoutubeDL(opts) as ydl:
+                ydl.download([video.url for video in videos])
+        except Exception as e:
+            self.logger.error(f"Batch download failed: {e}")
+
+        # Rename downloads to their requested titles
+        extension = f'.{self._base_opts["postprocessors"][0]["preferredcodec"]}'
+        downloaded_files = []
+        for video_id, filepath in finished.items():
+            title = title_by_id.get(video_id)
+            if title:
+                sanitized_filename = FileHelper.sanitize_filename(title)
+                target = FileHelper.generate_unique_filename(
+                    output_dir, sanitized_filename, extension
+                )
+                try:
+                    os.replace(filepath, target)
+                    filepath = target
+                except OSError as e:
+                    self.logger.warning(f"Could not rename {filepath}: {e}")
+            downloaded_files.append(filepath)
+
         return downloaded_files
 
     def get_audio_metadata(self, filepath: str) -> Dict[str, Any]:
@@ -168,18 +420,25 @@ class AudioDownloader:
         try:
             from mutagen.mp3 import MP3
             from mutagen.easyid3 import EasyID3
-            
+
+            # Stat once up front and reuse the result for the size field
+            try:
+                stat_result = os.stat(filepath)
+            except FileNotFoundError:
+                self.logger.error(f"Audio file not found: {filepath}")
+                return {}
+
             audio = MP3(filepath, ID3=EasyID3)
             metadata = {
                 'filename': os.path.basename(filepath),
-                'size': os.path.getsize(filepath),
+                'size': stat_result.st_size,
                 'duration': audio.info.length,
                 'bitrate': audio.info.bitrate,
                 'tags': dict(audio)
             }
-            
+
             return metadata
-        
+
         except ImportError:
             self.logger.warning("Mutagen library not available for metadata extraction")
             return {}
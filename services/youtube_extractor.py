@@ -1,11 +1,38 @@
-import yt_dlp
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from models.video_info import VideoInfo
 from utils.url_validator import YouTubeURLValidator
 from config import MAX_PLAYLIST_VIDEOS
+import functools
 import logging
 from datetime import datetime
 
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """
+    Parse a yt-dlp upload date string, memoized per distinct value
+
+    Channel and playlist extractions repeat the same dates constantly,
+    so cache hits skip strptime entirely.
+    """
+    # yt-dlp emits YYYYMMDD - decode it without strptime
+    if len(date_str) == 8 and date_str.isdigit():
+        try:
+            return datetime(
+                int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8])
+            )
+        except ValueError:
+            return None
+
+    for fmt in ['%Y-%m-%d', '%d.%m.%Y']:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
 class YouTubeExtractor:
     """
     Advanced YouTube video and playlist extraction service
@@ -44,6 +71,56 @@ class YouTubeExtractor:
             'age_limit': 0,
         }
 
+        # Lazily-created persistent sessions, one per thread - reuses
+        # HTTP keep-alive connections across extraction calls while
+        # staying safe under the concurrent metadata gather
+        self._thread_local = threading.local()
+        self._sessions = []
+
+        # Shared gather pool: keeping the worker threads alive is what
+        # lets their thread-local sessions be reused between gathers
+        self._gather_pool = None
+
+    def _get_ydl(self) -> 'yt_dlp.YoutubeDL':
+        """
+        Return this thread's persistent YoutubeDL session, creating it on first use
+        """
+        # Imported lazily - yt-dlp's import graph is heavy and only
+        # needed once an extraction actually starts
+        import yt_dlp
+
+        ydl = getattr(self._thread_local, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self.ydl_opts)
+            self._thread_local.ydl = ydl
+            self._sessions.append(ydl)
+        return ydl
+
+    def _get_gather_pool(self) -> ThreadPoolExecutor:
+        """
+        Return the shared metadata-gather pool, creating it on first use
+        """
+        if self._gather_pool is None:
+            self._gather_pool = ThreadPoolExecutor(max_workers=10)
+        return self._gather_pool
+
+    def close(self):
+        """
+        Release the gather pool and all persistent YoutubeDL sessions
+        """
+        if self._gather_pool is not None:
+            self._gather_pool.shutdown()
+            self._gather_pool = None
+        while self._sessions:
+            self._sessions.pop().close()
+        self._thread_local = threading.local()
+
+    def __enter__(self) -> 'YouTubeExtractor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _convert_duration(self, duration: Optional[int]) -> Optional[str]:
         """
         Convert duration seconds to human-readable format
@@ -56,19 +133,17 @@ class YouTubeExtractor:
         """
         if not duration:
             return None
-        
+
         hours, remainder = divmod(duration, 3600)
         minutes, seconds = divmod(remainder, 60)
-        
-        parts = []
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0:
-            parts.append(f"{minutes}m")
-        if seconds > 0:
-            parts.append(f"{seconds}s")
-        
-        return " ".join(parts) if parts else "0s"
+
+        # Format directly - no list build/join; the common short-video
+        # case returns after a single f-string
+        if hours:
+            return f"{hours}h {minutes}m {seconds}s"
+        if minutes:
+            return f"{minutes}m {seconds}s"
+        return f"{seconds}s"
 
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
         """
@@ -82,19 +157,34 @@ class YouTubeExtractor:
         """
         if not date_str:
             return None
-        
+
         try:
-            # Try multiple date formats
-            for fmt in ['%Y%m%d', '%Y-%m-%d', '%d.%m.%Y']:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-            return None
+            return _parse_date_cached(date_str)
         except Exception as e:
             self.logger.warning(f"Date parsing error: {e}")
             return None
 
+    def _entry_to_video_info(self, entry: Dict[str, Any], url: str) -> VideoInfo:
+        """
+        Map a yt-dlp info dict to a VideoInfo instance
+
+        Args:
+            entry (Dict[str, Any]): Info dict returned by yt-dlp
+            url (str): Video URL to record on the VideoInfo
+
+        Returns:
+            VideoInfo: Mapped video information
+        """
+        return VideoInfo(
+            url=url,
+            title=entry.get('title', 'Untitled Video'),
+            playlist_title=entry.get('playlist_title'),
+            duration=entry.get('duration'),
+            upload_date=self._parse_date(entry.get('upload_date')),
+            view_count=entry.get('view_count'),
+            thumbnail_url=entry.get('thumbnail')
+        )
+
     def extract_video_info(self, url: str) -> Optional[VideoInfo]:
         """
         Extract detailed information for a single video
@@ -110,27 +200,51 @@ class YouTubeExtractor:
             return None
 
         try:
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                info_dict = ydl.extract_info(url, download=False)
-                
-                if not info_dict:
-                    self.logger.warning(f"No info extracted for URL: {url}")
-                    return None
-
-                return VideoInfo(
-                    url=url,
-                    title=info_dict.get('title', 'Untitled Video'),
-                    playlist_title=info_dict.get('playlist_title'),
-                    duration=info_dict.get('duration'),
-                    upload_date=self._parse_date(info_dict.get('upload_date')),
-                    view_count=info_dict.get('view_count'),
-                    thumbnail_url=info_dict.get('thumbnail')
-                )
+            info_dict = self._get_ydl().extract_info(url, download=False)
+
+            if not info_dict:
+                self.logger.warning(f"No info extracted for URL: {url}")
+                return None
+
+            return self._entry_to_video_info(info_dict, url)
 
         except Exception as e:
             self.logger.error(f"Error extracting video info: {e}")
             return None
 
+    async def _gather_video_infos(self, urls: List[str]) -> List[Optional[VideoInfo]]:
+        """
+        Fetch metadata for independent URLs concurrently in worker threads
+
+        Args:
+            urls (List[str]): Video URLs to extract
+
+        Returns:
+            List[Optional[VideoInfo]]: Results aligned with the input order
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_gather_pool()
+        return await asyncio.gather(*[
+            loop.run_in_executor(pool, self.extract_video_info, url)
+            for url in urls
+        ])
+
+    def extract_video_infos(self, urls: List[str]) -> List[VideoInfo]:
+        """
+        Extract metadata for many URLs, bounded only by network round-trips
+
+        Args:
+            urls (List[str]): Video URLs to extract
+
+        Returns:
+            List[VideoInfo]: Extracted video information, failures dropped
+        """
+        if not urls:
+            return []
+
+        results = asyncio.run(self._gather_video_infos(urls))
+        return [video for video in results if video]
+
     def extract_playlist_videos(self, playlist_url: str) -> List[VideoInfo]:
         """
         Extract videos from a YouTube playlist
@@ -146,23 +260,38 @@ class YouTubeExtractor:
             return []
 
         try:
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                playlist_info = ydl.extract_info(playlist_url, download=False)
-                
-                if not playlist_info or 'entries' not in playlist_info:
-                    self.logger.warning(f"No entries found in playlist: {playlist_url}")
-                    return []
-
-                # Limit number of videos
-                entries = playlist_info['entries'][:self.max_videos]
-                
-                videos = []
-                for entry in entries:
-                    video = self.extract_video_info(entry['webpage_url'])
-                    if video:
-                        videos.append(video)
-
-                return videos
+            playlist_info = self._get_ydl().extract_info(playlist_url, download=False)
+
+            if not playlist_info or 'entries' not in playlist_info:
+                self.logger.warning(f"No entries found in playlist: {playlist_url}")
+                return []
+
+            # Limit number of videos
+            entries = playlist_info['entries'][:self.max_videos]
+
+            # The playlist extract already carries full per-entry
+            # metadata (extract_flat=False), so build VideoInfo
+            # objects inline instead of re-fetching each video
+            videos = []
+            pending = []  # (position, url) of entries needing a full fetch
+            for entry in entries:
+                if entry and entry.get('title'):
+                    videos.append(
+                        self._entry_to_video_info(entry, entry.get('webpage_url'))
+                    )
+                elif entry and entry.get('webpage_url'):
+                    # Incomplete entry - full fetch, gathered below
+                    pending.append((len(videos), entry['webpage_url']))
+                    videos.append(None)
+
+            if pending:
+                fetched = asyncio.run(
+                    self._gather_video_infos([url for _, url in pending])
+                )
+                for (position, _), video in zip(pending, fetched):
+                    videos[position] = video
+
+            return [video for video in videos if video]
 
         except Exception as e:
             self.logger.error(f"Playlist extraction error: {e}")
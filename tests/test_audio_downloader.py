@@ -0,0 +1,50 @@
+import os
+
+from services.audio_downloader import AudioDownloader
+from models.video_info import VideoInfo
+
+
+def test_persistent_session_prepare_filename(tmp_path):
+    """
+    The per-thread session must keep a template yt-dlp can render
+
+    YoutubeDL normalizes outtmpl into a dict at init; retargeting the
+    live session with a raw string breaks prepare_filename on every
+    later download, so exercise the real code path end to end.
+    """
+    downloader = AudioDownloader(output_dir=str(tmp_path))
+    target = str(tmp_path / 'Example Title.mp3')
+
+    ydl = downloader._get_ydl()
+    ydl.params['outtmpl'] = {'default': target}
+
+    prepared = ydl.prepare_filename({'title': 'Example Title', 'ext': 'mp3'})
+    assert prepared == target
+
+    # Retargeting the same session again must keep working
+    second = str(tmp_path / 'Another Title.mp3')
+    ydl.params['outtmpl'] = {'default': second}
+    assert ydl.prepare_filename({'title': 'x', 'ext': 'mp3'}) == second
+
+
+def test_assign_target_paths_unique_for_duplicate_titles(tmp_path):
+    downloader = AudioDownloader(output_dir=str(tmp_path))
+    videos = [VideoInfo(url=f'u{i}', title='Same Title') for i in range(3)]
+
+    paths = downloader.assign_target_paths(videos)
+
+    assert len(set(paths)) == 3
+    assert os.path.basename(paths[0]) == 'Same Title.mp3'
+    assert os.path.basename(paths[1]) == 'Same Title_1.mp3'
+    assert os.path.basename(paths[2]) == 'Same Title_2.mp3'
+
+
+def test_assign_target_paths_reuses_existing_file(tmp_path):
+    (tmp_path / 'Same Title.mp3').touch()
+    downloader = AudioDownloader(output_dir=str(tmp_path))
+    videos = [VideoInfo(url=f'u{i}', title='Same Title') for i in range(2)]
+
+    paths = downloader.assign_target_paths(videos)
+
+    # skip_existing maps both onto the file already on disk
+    assert paths[0] == paths[1] == str(tmp_path / 'Same Title.mp3')
@@ -87,15 +87,14 @@ class DownloadOptionsUI:
         """
         st.subheader("Video Selection")
         
-        # Display video information in an interactive table
-        video_data = [
-            {
-                "Select": False, 
-                "Title": v.title, 
-                "Duration": v.duration or "N/A"
-            } for v in videos
-        ]
-        
+        # Column-oriented table data: one list per column avoids a dict
+        # allocation per row and serializes faster for large playlists
+        video_data = {
+            "Select": [False] * len(videos),
+            "Title": [v.title for v in videos],
+            "Duration": [v.duration or 0 for v in videos]
+        }
+
         edited_df = st.data_editor(
             video_data,
             column_config={
@@ -104,17 +103,17 @@ class DownloadOptionsUI:
                     help="Check videos to download"
                 ),
                 "Title": st.column_config.TextColumn("Video Title"),
-                "Duration": st.column_config.TextColumn("Duration")
+                "Duration": st.column_config.NumberColumn("Duration (s)")
             },
             disabled=["Title", "Duration"]
         )
-        
+
         # Filter selected videos
         selected_indices = [
-            i for i, row in enumerate(edited_df) 
-            if row["Select"]
+            i for i, selected in enumerate(edited_df["Select"])
+            if selected
         ]
-        
+
         return [videos[i] for i in selected_indices]
 
     @staticmethod
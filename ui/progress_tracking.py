@@ -1,8 +1,9 @@
+import collections
 import streamlit as st
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Optional, Callable
-import threading
-import queue
 
 class DownloadProgressTracker:
     """
@@ -12,7 +13,7 @@ class DownloadProgressTracker:
     def __init__(self, total_videos: int):
         """
         Initialize progress tracker
-        
+
         Args:
             total_videos (int): Total number of videos to download
         """
@@ -20,9 +21,24 @@ class DownloadProgressTracker:
         self.current_video = 0
         self.successful_downloads = 0
         self.failed_downloads = 0
-        self.download_queue = queue.Queue()
-        self.download_thread = None
-        self.stop_event = threading.Event()
+
+        # Downloads are network-bound, so run them on a bounded pool
+        # instead of draining a queue one at a time
+        self._pool = ThreadPoolExecutor(max_workers=min(8, max(total_videos, 1)))
+        self._futures = {}
+        self._download_func = None
+
+        # Debounce state: every progress write is a websocket message,
+        # so batch them instead of pushing one per completed video.
+        # deque appends are O(1) and atomic in CPython, so producers
+        # never contend on a semaphore the way queue.Queue would
+        self._detail_rows = collections.deque()
+        self._last_flush = 0.0
+
+        # Guards the counters and detail rows - results are collected
+        # on the main thread, but the lock keeps the tracker correct if
+        # a caller reports progress from worker callbacks
+        self._lock = threading.Lock()
 
         # Streamlit-specific progress elements
         self.progress_bar = st.progress(0)
@@ -31,54 +47,12 @@ class DownloadProgressTracker:
 
     def start_download(self, download_func: Callable):
         """
-        Start asynchronous download process
-        
-        Args:
-            download_func (Callable): Function to execute downloads
-        """
-        self.download_thread = threading.Thread(
-            target=self._download_worker, 
-            args=(download_func,)
-        )
-        self.download_thread.start()
+        Register the download function used for queued tasks
 
-    def _download_worker(self, download_func: Callable):
-        """
-        Background download worker
-        
         Args:
             download_func (Callable): Function to execute downloads
         """
-        try:
-            while not self.stop_event.is_set():
-                # Fetch next download task
-                video = self.download_queue.get(timeout=1)
-                
-                if video is None:
-                    break
-                
-                try:
-                    # Execute download
-                    result = download_func(video)
-                    
-                    if result:
-                        self.successful_downloads += 1
-                        self._update_progress(video.title, success=True)
-                    else:
-                        self.failed_downloads += 1
-                        self._update_progress(video.title, success=False)
-                
-                except Exception as e:
-                    self.failed_downloads += 1
-                    self._update_progress(video.title, success=False, error=str(e))
-                
-                finally:
-                    self.download_queue.task_done()
-        
-        except queue.Empty:
-            pass
-        finally:
-            self.stop_event.set()
+        self._download_func = download_func
 
     def _update_progress(
         self, 
@@ -94,11 +68,27 @@ class DownloadProgressTracker:
             success (bool): Download success status
             error (Optional[str]): Error message if download failed
         """
-        self.current_video += 1
-        progress = self.current_video / self.total_videos
+        with self._lock:
+            self.current_video += 1
+            current = self.current_video
+
+            # Collect the detail row; rendered once in finalize_download
+            self._detail_rows.append({
+                "Video": video_title,
+                "Status": "Success" if success else "Failed",
+                "Error": error or ""
+            })
+
+            # Debounce the widget writes: flush at most every 200ms,
+            # plus always on the final video
+            now = time.monotonic()
+            if (now - self._last_flush) < 0.2 and current < self.total_videos:
+                return
+            self._last_flush = now
 
-        # Update Streamlit progress bar
-        self.progress_bar.progress(progress)
+        # Widget writes happen outside the lock; Streamlit elements are
+        # only touched from the main thread
+        self.progress_bar.progress(current / self.total_videos)
 
         # Status message
         status_message = f"Downloading: {video_title}"
@@ -106,35 +96,50 @@ class DownloadProgressTracker:
             status_message += " [FAILED]"
             if error:
                 status_message += f" - {error}"
-        
-        self.status_text.text(status_message)
 
-        # Detailed status logging
-        with self.detailed_status:
-            st.write(f"Video: {video_title}")
-            st.write(f"Status: {'Success' if success else 'Failed'}")
-            if error:
-                st.error(f"Error: {error}")
+        self.status_text.text(status_message)
 
     def add_download_task(self, video):
         """
-        Add video to download queue
-        
+        Submit a video download to the worker pool
+
         Args:
             video: Video to be downloaded
         """
-        self.download_queue.put(video)
+        future = self._pool.submit(self._download_func, video)
+        self._futures[future] = video
 
     def finalize_download(self):
         """
         Finalize download process and display summary
         """
-        # Wait for all downloads to complete
-        self.download_queue.join()
-        self.stop_event.set()
+        # Collect results as downloads finish, updating the UI from the
+        # main thread
+        for future in as_completed(self._futures):
+            video = self._futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                with self._lock:
+                    self.failed_downloads += 1
+                self._update_progress(video.title, success=False, error=str(e))
+            else:
+                if result:
+                    with self._lock:
+                        self.successful_downloads += 1
+                    self._update_progress(video.title, success=True)
+                else:
+                    with self._lock:
+                        self.failed_downloads += 1
+                    self._update_progress(video.title, success=False)
+
+        self._pool.shutdown()
+        self._futures.clear()
 
-        if self.download_thread:
-            self.download_thread.join()
+        # Render the detailed log once, as a single table
+        if self._detail_rows:
+            with self.detailed_status:
+                st.dataframe(list(self._detail_rows))
 
         # Display final summary
         st.success("Download Complete!")
@@ -174,11 +179,15 @@ class DownloadProgressTracker:
         Returns:
             dict: Download summary statistics
         """
+        successful_count = len(successful_videos)
+        failed_count = len(failed_videos)
+        total = successful_count + failed_count
+
         return {
-            "total_videos": len(successful_videos) + len(failed_videos),
-            "successful_count": len(successful_videos),
-            "failed_count": len(failed_videos),
-            "success_rate": len(successful_videos) / (len(successful_videos) + len(failed_videos)) * 100,
+            "total_videos": total,
+            "successful_count": successful_count,
+            "failed_count": failed_count,
+            "success_rate": (successful_count / total * 100) if total else 0.0,
             "successful_videos": [v.title for v in successful_videos],
             "failed_videos": [v.title for v in failed_videos]
         }
\ No newline at end of file
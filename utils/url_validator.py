@@ -1,67 +1,67 @@
+import functools
 import re
 from urllib.parse import urlparse, parse_qs
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
 class YouTubeURLValidator:
     """
     Comprehensive URL validation and extraction utility for YouTube URLs
     """
-    
-    # Regular expressions for different YouTube URL patterns
-    YOUTUBE_PATTERNS = {
-        'standard_video': r'^(https?\:\/\/)?(www\.youtube\.com\/watch\?v=)([^&]+)',
-        'shortened_video': r'^(https?\:\/\/)?(youtu\.be\/)([^&\?]+)',
-        'playlist': r'^(https?\:\/\/)?(www\.youtube\.com\/playlist\?list=)([^&]+)',
-        'channel': r'^(https?\:\/\/)?(www\.youtube\.com\/channel\/)([^&\/]+)'
-    }
+
+    # Hostnames accepted for full-site YouTube URLs
+    YOUTUBE_HOSTS = frozenset({
+        'youtube.com',
+        'www.youtube.com',
+        'm.youtube.com'
+    })
+
+    @classmethod
+    def _parse(cls, url: str) -> Tuple[str, str, Dict[str, List[str]]]:
+        """
+        Split a URL into lowercased host, path, and query parameters
+
+        Args:
+            url (str): URL to split
+
+        Returns:
+            Tuple[str, str, Dict[str, List[str]]]: (host, path, query params)
+        """
+        if not url or not isinstance(url, str):
+            return '', '', {}
+
+        # Scheme-less URLs would land entirely in .path; force a netloc
+        parsed = urlparse(url if '//' in url else f'//{url}')
+        return parsed.netloc.lower(), parsed.path, parse_qs(parsed.query)
 
     @classmethod
     def validate_youtube_url(cls, url: str) -> bool:
         """
         Validates if the given URL is a valid YouTube URL
-        
+
         Args:
             url (str): URL to validate
-        
+
         Returns:
             bool: True if valid YouTube URL, False otherwise
         """
         if not url or not isinstance(url, str):
             return False
-        
-        # Check against predefined patterns
-        return any(
-            re.match(pattern, url, re.IGNORECASE)
-            for pattern in cls.YOUTUBE_PATTERNS.values()
-        )
+        return _validate(url)
 
     @classmethod
     def extract_video_id(cls, url: str) -> Optional[str]:
         """
         Extracts the video ID from various YouTube URL formats
-        
+
         Args:
             url (str): YouTube video URL
-        
+
         Returns:
             Optional[str]: Extracted video ID or None
         """
         if not cls.validate_youtube_url(url):
             return None
-        
-        # Video ID extraction strategies
-        extractors = [
-            lambda u: re.search(r'v=([^&]+)', u),
-            lambda u: re.search(r'youtu\.be\/([^&\?]+)', u),
-            lambda u: re.search(r'embed\/([^&\?]+)', u)
-        ]
-        
-        for extractor in extractors:
-            match = extractor(url)
-            if match:
-                return match.group(1)
-        
-        return None
+        return _extract_video_id(url)
 
     @classmethod
     def parse_youtube_url(cls, url: str) -> Dict[str, str]:
@@ -96,7 +96,12 @@ class YouTubeURLValidator:
         Returns:
             bool: True if playlist URL, False otherwise
         """
-        return bool(re.match(cls.YOUTUBE_PATTERNS['playlist'], url, re.IGNORECASE))
+        host, path, query_params = cls._parse(url)
+        return (
+            host in cls.YOUTUBE_HOSTS
+            and path == '/playlist'
+            and 'list' in query_params
+        )
 
     @classmethod
     def is_channel_url(cls, url: str) -> bool:
@@ -109,7 +114,12 @@ class YouTubeURLValidator:
         Returns:
             bool: True if channel URL, False otherwise
         """
-        return bool(re.match(cls.YOUTUBE_PATTERNS['channel'], url, re.IGNORECASE))
+        host, path, _ = cls._parse(url)
+        return (
+            host in cls.YOUTUBE_HOSTS
+            and path.startswith('/channel/')
+            and len(path) > len('/channel/')
+        )
 
     @classmethod
     def sanitize_url(cls, url: str) -> Optional[str]:
@@ -131,5 +141,36 @@ class YouTubeURLValidator:
         # Ensure https protocol
         if not cleaned_url.startswith(('http://', 'https://')):
             cleaned_url = f'https://{cleaned_url}'
-        
-        return cleaned_url
\ No newline at end of file
+
+        return cleaned_url
+
+# Memoized cores - a playlist expansion validates and re-parses the
+# same URL several times (validate, extract, playlist check), so repeat
+# calls become a dict lookup
+@functools.lru_cache(maxsize=4096)
+def _validate(url: str) -> bool:
+    host, path, query_params = YouTubeURLValidator._parse(url)
+
+    if host == 'youtu.be':
+        return len(path) > 1
+
+    if host in YouTubeURLValidator.YOUTUBE_HOSTS:
+        return (
+            (path == '/watch' and 'v' in query_params)
+            or (path == '/playlist' and 'list' in query_params)
+            or path.startswith(('/channel/', '/embed/'))
+        )
+
+    return False
+
+@functools.lru_cache(maxsize=4096)
+def _extract_video_id(url: str) -> Optional[str]:
+    host, path, query_params = YouTubeURLValidator._parse(url)
+
+    if host == 'youtu.be':
+        return path[1:] or None
+
+    if '/embed/' in path:
+        return path.split('/embed/', 1)[1] or None
+
+    return query_params.get('v', [None])[0]
\ No newline at end of file